@@ -0,0 +1,211 @@
+import functools
+import operator
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import fields as dataclass_fields
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from vtop_client import VtopClient
+
+# Where the time goes: VTOP round-trips (login, then one POST per view) take
+# seconds, and re-rendering a page takes a fraction of one. The pandas work
+# on a few dozen records is noise. So the fetches are cached first, the pages
+# run as fragments second, and the DataFrame building is vectorized last.
+#
+# Every fetch is cached per (reg_no, sem_id); a login per (username,
+# password). The leading underscore on `_client` keeps Streamlit from trying
+# to hash the client object. The pages only read the returned dataclasses, so
+# they are cached by reference (cache_resource) rather than unpickled into a
+# fresh copy on every rerun (cache_data). Underneath, the client keeps its own
+# RESULT_TTL cache of the same results (see `_cached` in vtop_client.py), so
+# the two caches are stacked: data can be up to CACHE_TTL + RESULT_TTL old.
+CACHE_TTL = 600
+# How long a logged-in client is reused before the next login does a fresh handshake.
+LOGIN_TTL = 1800
+# Set VTOP_DEBUG_PROFILE=1 to time every uncached VTOP call; main.py lists the
+# current user's latest timings in the sidebar. The dict is shared by every
+# session in the process, so timings are keyed by the call's first argument:
+# the username for a login, the reg_no for a fetch.
+DEBUG_PROFILE = os.environ.get("VTOP_DEBUG_PROFILE") == "1"
+FETCH_TIMINGS = {}
+
+
+def profiled(func):
+    """Record how long each call of `func` takes in FETCH_TIMINGS[args[0]] when DEBUG_PROFILE is on."""
+    if not DEBUG_PROFILE:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            FETCH_TIMINGS.setdefault(args[0], {})[func.__name__] = time.perf_counter() - start
+    return wrapper
+
+
+@st.cache_resource(ttl=LOGIN_TTL, show_spinner=False)
+@profiled
+def get_logged_in_client(username, password):
+    """Return a logged-in VtopClient for these credentials, reusing a live one.
+
+    A returning user (a new tab, a reconnect) gets the existing session and
+    its cookies instead of repeating the captcha and login round-trips.
+    Streamlit keys the cache on a hash of the arguments, so the password
+    itself isn't kept in the key. A failed login raises, and errors are not
+    cached.
+    """
+    client = VtopClient(username, password)
+    client.login()
+    return client
+
+
+def forget_expired_login(client):
+    """Drop `client` from the login cache once VTOP has expired its session.
+
+    Without this a new tab or a reload would get the dead client back from
+    `get_logged_in_client` until LOGIN_TTL runs out.
+    """
+    if not client.is_authenticated:
+        get_logged_in_client.clear(client.username, client.password)
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+@profiled
+def fetch_semesters(reg_no, _client):
+    return _client.get_semesters()
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+@profiled
+def fetch_attendance(reg_no, sem_id, _client):
+    return _client.get_attendance(sem_id)
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+@profiled
+def fetch_timetable(reg_no, sem_id, _client):
+    return _client.get_timetable(sem_id)
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+@profiled
+def fetch_marks(reg_no, sem_id, _client):
+    return _client.get_marks(sem_id)
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+@profiled
+def fetch_exam_schedule(reg_no, sem_id, _client):
+    return _client.get_exam_schedule(sem_id)
+
+
+def get_executor():
+    """Return the session's thread pool, creating it on first use."""
+    if 'executor' not in st.session_state:
+        st.session_state.executor = ThreadPoolExecutor(max_workers=4)
+    return st.session_state.executor
+
+
+def prefetch(client, sem_id):
+    """Start fetching every view of a semester in the background.
+
+    Returns immediately. The fetches are I/O-bound, so they overlap on the
+    session's thread pool and a page switch usually finds its data already
+    cached. The futures are kept in session state so a view can wait on an
+    in-flight request instead of sending a duplicate.
+    """
+    key = (client.reg_no, sem_id)
+    pending = st.session_state.setdefault('prefetched', {})
+    if key in pending:
+        return
+    executor = get_executor()
+    pending[key] = {
+        fetch: executor.submit(fetch, client.reg_no, sem_id, client)
+        for fetch in (fetch_attendance, fetch_timetable, fetch_marks, fetch_exam_schedule)
+    }
+
+
+def get_view_data(fetch, client, sem_id):
+    """Return `fetch`'s data for a semester, waiting for a running prefetch first.
+
+    Once the prefetch is done the cached fetcher is called as usual, so it
+    returns the cached result or, if the prefetch failed, retries and raises
+    the error where the view can show it. An expired session is also dropped
+    from the login cache, so logging in again starts a new one.
+    """
+    future = st.session_state.get('prefetched', {}).get((client.reg_no, sem_id), {}).get(fetch)
+    if future is not None:
+        wait([future])
+    try:
+        return fetch(client.reg_no, sem_id, client)
+    except Exception:
+        forget_expired_login(client)
+        raise
+
+
+def data_key(client, data):
+    """Cheap cache key for fetched data: whose it is, which semester, and when it was scraped."""
+    return (client.reg_no, data.semester_id, data.update_time)
+
+
+def semester_options():
+    """Map semester names to ids for the selectbox.
+
+    The dict is rebuilt only when `st.session_state.semesters` is replaced, not
+    on every rerun. Holding the source list keeps its identity check reliable.
+    """
+    semesters = st.session_state.semesters
+    if st.session_state.get('_sem_options_source') is not semesters:
+        st.session_state._sem_options = {sem.name: sem.id for sem in semesters}
+        st.session_state._sem_options_source = semesters
+    return st.session_state._sem_options
+
+
+def parse_percentage(value):
+    """Parse a VTOP percentage such as '85' or '85%' into a float, NaN if it isn't one."""
+    if isinstance(value, str):
+        value = value.rstrip('%')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def records_to_df(records, fields=None, converters=None, dtype=None):
+    """Build a DataFrame column by column from a list of dataclass records.
+
+    `fields` defaults to every field of the record class. Reading each column
+    with `operator.attrgetter` skips the per-record dict that `asdict` builds.
+    `converters` maps a field name to a function applied to each of its values
+    while the column is assembled, and `dtype` maps a field name to the dtype
+    its column is built with (e.g. 'category' for low-cardinality strings).
+    """
+    if fields is None:
+        fields = [f.name for f in dataclass_fields(records[0])] if records else []
+    converters = converters or {}
+    dtype = dtype or {}
+    columns = {}
+    for name in fields:
+        column = map(operator.attrgetter(name), records)
+        if name in converters:
+            column = map(converters[name], column)
+        columns[name] = pd.Series(list(column), dtype=dtype.get(name))
+    return pd.DataFrame(columns)
+
+
+def group_records_to_dfs(groups, attr, fields=None, **kwargs):
+    """Build one DataFrame from every group's `attr` records, then split it per group.
+
+    Returns a dict from a group's position in `groups` to its rows; groups with
+    no records are left out. Extra keyword arguments go to `records_to_df`.
+    """
+    children = [getattr(group, attr) or [] for group in groups]
+    df = records_to_df([record for child in children for record in child], fields, **kwargs)
+    group_idx = np.repeat(np.arange(len(children)), [len(child) for child in children])
+    return dict(iter(df.groupby(group_idx, sort=False)))
@@ -0,0 +1,251 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import (
+    CACHE_TTL, fetch_attendance, fetch_timetable, fetch_marks, fetch_exam_schedule,
+    get_view_data, data_key, records_to_df, parse_percentage, group_records_to_dfs,
+)
+
+# --- Timetable Constants ---
+# The grid's rows are the days in DAY_MAP and its columns are hourly slots.
+# The CSS is re-sent on every rerun (Streamlit drops elements a run doesn't
+# emit), but is built only once.
+SLOT_HOURS = range(8, 18)
+TIME_SLOTS = tuple(f"{h:02d}:00" for h in SLOT_HOURS)
+DAY_ORDER = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+DAY_FULL_NAMES = {
+    "MON": "Monday",
+    "TUE": "Tuesday",
+    "WED": "Wednesday",
+    "THU": "Thursday",
+    "FRI": "Friday",
+    "SAT": "Saturday",
+    "SUN": "Sunday"
+}
+# The grid covers the teaching week, Monday to Saturday.
+DAY_MAP = {code: DAY_FULL_NAMES[code] for code in DAY_ORDER[:6]}
+# Dark-mode friendly cell colors with white text
+FILLED_CELL_STYLE = "background-color: #022B3A; color: white; border-left: 5px solid #00A9A5; padding: 10px; border-radius: 5px; text-align: center; font-size: 14px; min-height: 70px; vertical-align: middle;"
+EMPTY_CELL = "<td style='background-color: #262730;'></td>" # Dark background for empty slots
+TIMETABLE_CSS = """
+<style>
+table { width: 100%; border-collapse: separate; border-spacing: 5px; }
+th, td { border: 1px solid #333; padding: 8px; text-align: center; border-radius: 5px; }
+th { background-color: #1a1a1a; color: #FAFAFA; } /* Dark header for dark mode */
+</style>
+"""
+
+# --- Exam Constants ---
+EXAM_NAME_PATTERNS = (
+    (re.compile(r"continuous assessment test - i\b", re.I), "CAT-1"),
+    (re.compile(r"continuous assessment test - ii\b", re.I), "CAT-2"),
+    (re.compile(r"final assessment test", re.I), "FAT"),
+)
+
+
+# --- Helper Functions ---
+@lru_cache(maxsize=16)
+def map_exam_name(long_name):
+    return next((label for pattern, label in EXAM_NAME_PATTERNS if pattern.search(long_name)), long_name.title())
+
+def status_pie_figure():
+    """Return this session's attendance status pie, built once and updated in place on reruns."""
+    if 'status_pie' not in st.session_state:
+        # plotly pulls in hundreds of modules; only load it once a chart is drawn.
+        import plotly.graph_objects as go
+        fig = go.Figure(data=[go.Pie(hole=.6)])
+        fig.update_layout(title_text='Status Overview', showlegend=False, height=200, margin=dict(t=30, b=0, l=0, r=0))
+        st.session_state.status_pie = fig
+    return st.session_state.status_pie
+
+
+# --- Attendance Page ---
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_attendance(key, _data):
+    """Parse a semester's attendance into (df, status_counts, average, low_count).
+
+    `key` (see `data_key`) identifies `_data`, which Streamlit doesn't hash.
+    The frame is empty when no percentage could be parsed.
+    """
+    df = records_to_df(_data.records, converters={'attendance_percentage': parse_percentage}, dtype={'debar_status': 'category'})
+    df.dropna(subset=['attendance_percentage'], inplace=True)
+    if df.empty:
+        return df, None, None, None
+    df['attendance_percentage'] = df['attendance_percentage'].astype('int8')
+    df['status'] = pd.cut(df['attendance_percentage'], bins=[-np.inf, 75, 85, np.inf], right=False, labels=['Danger', 'Warning', 'Safe'])
+    status_counts = df['status'].value_counts()
+    status_counts = status_counts[status_counts > 0]
+    avg_attendance = df['attendance_percentage'].mean()
+    low_attendance_courses = df[df['attendance_percentage'] < 75].shape[0]
+    return df, status_counts, avg_attendance, low_attendance_courses
+
+@st.fragment
+def render_attendance(client, sem_id):
+    with st.spinner("Fetching Attendance..."):
+        data = get_view_data(fetch_attendance, client, sem_id)
+    if data and data.records:
+        df, status_counts, avg_attendance, low_attendance_courses = build_attendance(data_key(client, data), data)
+        if df.empty:
+            st.warning("Could not parse any valid attendance data.")
+            return
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Attendance Summary")
+            mcol1, mcol2 = st.columns(2)
+            mcol1.metric("Average", f"{avg_attendance:.2f}%")
+            mcol2.metric("Courses < 75%", f"{low_attendance_courses} 😟")
+        with col2:
+            colors = {'Safe': 'mediumseagreen', 'Warning': 'orange', 'Danger': 'tomato'}
+            fig = status_pie_figure()
+            fig.update_traces(labels=list(status_counts.index), values=status_counts.values, marker_colors=[colors.get(key) for key in status_counts.index])
+            st.plotly_chart(fig, width="stretch", key=f"att_status_{sem_id}")
+
+        st.markdown("---")
+
+        st.subheader("Detailed View")
+        st.dataframe(df, width="stretch")
+    else:
+        st.warning("No attendance data found.")
+
+
+# --- Timetable Page ---
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_timetable(key, _data):
+    """Build a semester's weekly grid HTML and its per-day tables.
+
+    Returns (grid_html, day_frames). grid_html is None when no slot has a
+    parseable start time; day_frames is a list of (day name, DataFrame) in
+    week order.
+    """
+    df = records_to_df(_data.slots, ('day', 'start_time', 'end_time', 'course_code', 'name', 'slot', 'room_no'), dtype={'day': 'category', 'slot': 'category'})
+
+    # 'H:MM' or 'HH:MM' -> minutes since midnight, without a datetime parse.
+    # Accepts exactly what pd.to_datetime(format='%H:%M') would.
+    valid_mask = df['start_time'].str.fullmatch(r'([01]?\d|2[0-3]):[0-5]?\d', na=False)
+    valid_time_df = df[valid_mask]
+
+    grid_html = None
+    if not valid_time_df.empty:
+        hours_minutes = valid_time_df['start_time'].str.split(':', n=1, expand=True).astype('int16')
+        valid_time_df = valid_time_df.assign(start_m=hours_minutes[0] * 60 + hours_minutes[1])
+
+        # (day, hour) -> first class starting then; one pass instead of a pivot per field.
+        lookup = {}
+        for row in valid_time_df.itertuples(index=False):
+            lookup.setdefault((row.day, row.start_m // 60), row)
+
+        parts = ["<table><tr><th>Day</th>"]
+        parts.extend(f"<th>{time}</th>" for time in TIME_SLOTS)
+        parts.append("</tr>")
+        for day_code, day in DAY_MAP.items():
+            parts.append(f"<tr><td><b>{day}</b></td>")
+            for hour in SLOT_HOURS:
+                info = lookup.get((day_code, hour))
+                if info is not None:
+                    parts.append(f"<td style='{FILLED_CELL_STYLE}'><b>{info.course_code}</b><br>{info.name}<br><i>{info.room_no}</i></td>")
+                else:
+                    parts.append(EMPTY_CELL)
+            parts.append("</tr>")
+        parts.append("</table>")
+        grid_html = "".join(parts)
+
+    schedule_df = df.assign(start_time=df['start_time'].mask(df['slot'] == 'LUNCH', '14:00'))
+    schedule_df = schedule_df.sort_values(by='start_time', kind='stable')
+    day_groups = dict(iter(schedule_df.groupby('day', sort=False, observed=True)))
+    day_frames = [
+        (DAY_FULL_NAMES.get(day_code, day_code), day_groups[day_code].drop(columns=['day']))
+        for day_code in DAY_ORDER if day_code in day_groups
+    ]
+    return grid_html, day_frames
+
+@st.fragment
+def render_timetable(client, sem_id):
+    with st.spinner("Fetching Timetable..."):
+        data = get_view_data(fetch_timetable, client, sem_id)
+    if data.slots:
+        grid_html, day_frames = build_timetable(data_key(client, data), data)
+
+        st.subheader("Weekly Grid View")
+        if grid_html is not None:
+            st.markdown(TIMETABLE_CSS, unsafe_allow_html=True)
+
+            st.markdown(grid_html, unsafe_allow_html=True)
+        else:
+            st.warning("No valid timetable slots to display in grid view.")
+
+        st.subheader("Day-by-day Schedule")
+        for day_name, day_df in day_frames:
+            st.write(f"#### 🗓️ {day_name}")
+            st.dataframe(day_df, width="stretch", hide_index=True)
+    else:
+        st.warning("No timetable data found.")
+
+
+# --- Marks Page ---
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_marks(key, _data):
+    """Split a semester's marks into one DataFrame per course, keyed by position."""
+    return group_records_to_dfs(_data.records, 'marks')
+
+@st.fragment
+def render_marks(client, sem_id):
+    with st.spinner("Fetching Marks..."):
+        data = get_view_data(fetch_marks, client, sem_id)
+    if data.records:
+        st.subheader("Detailed Marks per Course")
+        marks_frames = build_marks(data_key(client, data), data)
+        for i, record in enumerate(data.records):
+            # Expanders track their open state, so closed courses skip building their table.
+            with st.expander(f"**{record.coursecode}** - {record.coursetitle}", key=f"marks_{sem_id}_{i}", on_change="rerun") as expander:
+                if expander.open:
+                    st.write(f"**Faculty:** {record.faculity} | **Slot:** {record.slot}")
+                    marks_df = marks_frames.get(i)
+                    if marks_df is not None:
+                        st.dataframe(marks_df, width="stretch", hide_index=True)
+                    else:
+                        st.info("No marks uploaded yet for this course.")
+    else:
+        st.warning("No marks data found.")
+
+
+# --- Exam Schedule Page ---
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def build_exam_schedule(key, _data):
+    """Return (tab labels, per-group DataFrames keyed by position) for a semester's exams."""
+    exam_types = [map_exam_name(exam.exam_type) for exam in _data.exams]
+    exam_frames = group_records_to_dfs(_data.exams, 'records', ('course_code', 'course_name', 'exam_date', 'exam_time', 'venue', 'seat_location', 'seat_no'))
+    return exam_types, exam_frames
+
+@st.fragment
+def render_exam_schedule(client, sem_id):
+    with st.spinner("Fetching Exam Schedule..."):
+        data = get_view_data(fetch_exam_schedule, client, sem_id)
+
+    if data and data.exams:
+        st.subheader("Exam Schedules")
+        exam_types, exam_frames = build_exam_schedule(data_key(client, data), data)
+        tabs = st.tabs(exam_types)
+
+        for i, exam_group in enumerate(data.exams):
+            with tabs[i]:
+                df = exam_frames.get(i)
+                if df is not None:
+                    st.dataframe(df, width="stretch", hide_index=True)
+                else:
+                    st.info(f"No schedule found for {exam_group.exam_type}")
+    else:
+        st.warning("No exam schedule data found.")
+
+
+# Page name -> renderer. Every renderer is an st.fragment taking (client, sem_id).
+VIEWS = {
+    "Attendance": render_attendance,
+    "Timetable": render_timetable,
+    "Marks": render_marks,
+    "Exam Schedule": render_exam_schedule,
+}
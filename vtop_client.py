@@ -1,24 +1,129 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import base64
+import functools
+import inspect
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional
 import time
 
 BASE_URL = "https://vtop.vitap.ac.in/vtop"
 CAPTCHA_URL = "https://cap.va.synaptic.gg/captcha"
-
-@dataclass
+REQUEST_TIMEOUT = 30
+# How long semester, timetable, marks and exam results are reused before VTOP is asked again.
+RESULT_TTL = 300
+
+
+def _parse_html(html):
+    """Parse a VTOP page or fragment (bytes or str) into an lxml tree rooted at <html>."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except etree.ParserError:  # empty document
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _read_html(response):
+    """Parse a streamed response chunk by chunk as it arrives.
+
+    Parsing overlaps the download, and the body is never held as one big str.
+    The encoding is forced only when the Content-Type header names a charset;
+    otherwise requests' ISO-8859-1 fallback would override the page's
+    <meta charset>, so lxml is left to detect it as `_parse_html` does.
+    """
+    declared = 'charset' in response.headers.get('content-type', '').lower()
+    parser = lxml.html.HTMLParser(encoding=response.encoding if declared else None)
+    for chunk in response.iter_content(chunk_size=16384):
+        parser.feed(chunk)
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:  # empty document
+        return lxml.html.document_fromstring("<html></html>")
+
+
+def _cached(method):
+    """Reuse a `get_*` method's result for the same arguments for RESULT_TTL seconds.
+
+    Results live on the client, in `self._cache`; `refresh()` empties it.
+    Positional and keyword calls are bound to the method's signature first,
+    so `get_timetable("X")` and `get_timetable(semester_id="X")` share an entry.
+    In the Streamlit app this sits under utils.py's `st.cache_resource`
+    fetchers (CACHE_TTL), so a result can be up to both TTLs old.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, *bound.args[1:], *sorted(bound.kwargs.items()))
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() < hit[0]:
+            return hit[1]
+        result = method(self, *args, **kwargs)
+        self._cache[key] = (time.monotonic() + RESULT_TTL, result)
+        return result
+    return wrapper
+
+
+def _input_value(pattern, body):
+    """Return the value of the first <input> tag `pattern` finds in the bytes `body`, or ""."""
+    tag = pattern.search(body)
+    value = _VALUE_ATTR.search(tag.group()) if tag else None
+    return value.group(1).decode() if value else ""
+
+
+def _text(element):
+    """Return an element's text like bs4's get_text(strip=True): every text node stripped, then joined."""
+    return "".join(text.strip() for text in element.itertext()) if element is not None else ""
+
+
+def _cell_texts(cells):
+    """Return each cell's text, stripped by `_text`, in a single comprehension."""
+    return [_text(cell) for cell in cells]
+
+
+def _has_class(name):
+    """XPath predicate matching elements whose class list contains `name`, like CSS `.name`."""
+    return f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+# Page lookups, compiled once at import rather than per request. Each call
+# selects and filters a page's rows in C instead of walking every <tr> in Python.
+_CAPTCHA_SRC = etree.XPath("string((//img" + _has_class("img-fluid") + ")[1]/@src)")
+_SEMESTER_OPTIONS = etree.XPath('//select[@name="semesterSubId"]//option')
+_CELLS = etree.XPath("./td")
+_ATTENDANCE_ROWS = etree.XPath("//tr[count(td) > 10]")
+_MARKS_ROWS = etree.XPath("//tr" + _has_class("tableContent"))
+_MARKS_SUBROWS = etree.XPath("(.//table)[1]//tr" + _has_class("tableContent-level1"))
+_EXAM_ROWS = etree.XPath("./tr[position() > 2]")
+# The CSRF token and registration number are read from the raw login responses
+# with these, without building a DOM for pages that need nothing else.
+_CSRF_INPUT = re.compile(rb"""<input\b[^>]*?\sname\s*=\s*["']_csrf["'][^>]*>""", re.I)
+_REG_NO_INPUT = re.compile(rb"""<input\b[^>]*?\sname\s*=\s*["']authorizedIDX["'][^>]*>""", re.I)
+_VALUE_ATTR = re.compile(rb"""\svalue\s*=\s*["']([^"']*)["']""", re.I)
+# A timetable cell such as "A1 - CSE1001 - ETH - AB1 - 101 - ALL"; only the first five fields are used.
+_SLOT_FIELDS = re.compile(r"\s*-\s*")
+# The attendance detail link, e.g. "processViewAttendanceDetail('sem', 'reg', 'course_id', 'type')".
+_ONCLICK = re.compile(r"\(\s*'([^']*)'\s*,\s*'([^']*)'\s*,\s*'([^']*)'\s*,\s*'([^']*)'")
+
+@dataclass(slots=True)
 class SemesterInfo:
     id: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class SemesterData:
     semesters: List[SemesterInfo]
     update_time: int
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceRecord:
     serial: str
     category: str
@@ -33,13 +138,13 @@ class AttendanceRecord:
     debar_status: str
     course_id: str
 
-@dataclass
+@dataclass(slots=True)
 class AttendanceData:
     records: List[AttendanceRecord]
     semester_id: str
     update_time: int
 
-@dataclass
+@dataclass(slots=True)
 class FullAttendanceRecord:
     serial: str
     date: str
@@ -48,7 +153,7 @@ class FullAttendanceRecord:
     status: str
     remark: str
 
-@dataclass
+@dataclass(slots=True)
 class FullAttendanceData:
     records: List[FullAttendanceRecord]
     semester_id: str
@@ -56,7 +161,7 @@ class FullAttendanceData:
     course_id: str
     course_type: str
 
-@dataclass
+@dataclass(slots=True)
 class TimetableSlot:
     serial: str
     day: str
@@ -69,13 +174,13 @@ class TimetableSlot:
     end_time: str
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class TimetableData:
     slots: List[TimetableSlot]
     semester_id: str
     update_time: int
 
-@dataclass
+@dataclass(slots=True)
 class MarksRecordEach:
     serial: str
     markstitle: str
@@ -86,7 +191,7 @@ class MarksRecordEach:
     weightagemark: str
     remark: str
 
-@dataclass
+@dataclass(slots=True)
 class MarksRecord:
     serial: str
     coursecode: str
@@ -96,20 +201,21 @@ class MarksRecord:
     slot: str
     marks: List[MarksRecordEach]
 
-@dataclass
+@dataclass(slots=True)
 class MarksData:
     records: List[MarksRecord]
     semester_id: str
     update_time: int
 
-@dataclass
+@dataclass(slots=True)
 class ExamScheduleRecord:
+    # In the schedule table's column order, so a row's cells map onto it positionally.
     serial: str
-    slot: str
-    course_name: str
     course_code: str
+    course_name: str
     course_type: str
     course_id: str
+    slot: str
     exam_date: str
     exam_session: str
     reporting_time: str
@@ -118,12 +224,12 @@ class ExamScheduleRecord:
     seat_location: str
     seat_no: str
 
-@dataclass
+@dataclass(slots=True)
 class PerExamScheduleRecord:
     exam_type: str
     records: List[ExamScheduleRecord]
 
-@dataclass
+@dataclass(slots=True)
 class ExamScheduleData:
     exams: List[PerExamScheduleRecord]
     semester_id: str
@@ -137,22 +243,45 @@ class VtopClient:
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Linux; U; Linux x86_64; en-US) Gecko/20100101 Firefox/130.5"
         })
+        # Transient gateway errors and failed connections are retried with backoff.
+        # A POST is only retried if it never reached VTOP; urllib3 won't re-send
+        # one the server may already have processed.
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # A separate keep-alive session for the captcha solver, so retries and
+        # later logins reuse its connection instead of a new TLS handshake.
+        self.captcha_session = requests.Session()
         self.is_authenticated = False
         self.csrf_token = None
         self.reg_no = None
+        self._cache = {}
+
+    def refresh(self):
+        """Forget cached results, so the next `get_*` call fetches from VTOP again."""
+        self._cache.clear()
+
+    def close(self):
+        self.session.close()
+        self.captcha_session.close()
 
     def _get_text(self, element):
-        return element.get_text(strip=True) if element else ""
+        return _text(element)
 
-    def _get_csrf(self, soup):
-        csrf_tag = soup.find("input", {"name": "_csrf"})
-        if csrf_tag:
-            self.csrf_token = csrf_tag['value']
+    def _get_csrf(self, body):
+        csrf_token = _input_value(_CSRF_INPUT, body)
+        if csrf_token:
+            self.csrf_token = csrf_token
 
     def _solve_captcha(self, captcha_data):
         try:
-            img_string = base64.urlsafe_b64encode(captcha_data.encode()).decode()
-            response = requests.post(CAPTCHA_URL, json={"imgstring": img_string})
+            # The solver takes the whole data URL, base64-encoded again; a data URL is pure ASCII.
+            img_string = base64.urlsafe_b64encode(captcha_data.encode("ascii"))
+            # The urlsafe base64 alphabet needs no JSON escaping, so the body is
+            # assembled as bytes instead of round-tripping the image through json.dumps.
+            body = b'{"imgstring": "' + img_string + b'"}'
+            response = self.captcha_session.post(CAPTCHA_URL, data=body, headers={"Content-Type": "application/json"}, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             return response.text
         except requests.RequestException:
@@ -162,21 +291,19 @@ class VtopClient:
         max_retries = 3
         for _ in range(max_retries):
             try:
-                res = self.session.get(f"{BASE_URL}/open/page")
+                res = self.session.get(f"{BASE_URL}/open/page", timeout=REQUEST_TIMEOUT)
                 res.raise_for_status()
-                soup = BeautifulSoup(res.text, "lxml")
-                self._get_csrf(soup)
+                self._get_csrf(res.content)
                 if not self.csrf_token:
                     continue
 
-                res = self.session.post(f"{BASE_URL}/prelogin/setup", data={"_csrf": self.csrf_token, "flag": "VTOP"})
+                res = self.session.post(f"{BASE_URL}/prelogin/setup", data={"_csrf": self.csrf_token, "flag": "VTOP"}, timeout=REQUEST_TIMEOUT)
                 res.raise_for_status()
-                soup = BeautifulSoup(res.text, "lxml")
-                captcha_tag = soup.find("img", class_="img-fluid")
-                if not captcha_tag or 'base64,' not in captcha_tag['src']:
+                tree = _parse_html(res.content)
+                captcha_data = _CAPTCHA_SRC(tree)
+                if 'base64,' not in captcha_data:
                     continue
-                
-                captcha_data = captcha_tag['src']
+
                 captcha_solution = self._solve_captcha(captcha_data)
                 if not captcha_solution:
                     continue
@@ -187,20 +314,20 @@ class VtopClient:
                     "password": self.password,
                     "captchaStr": captcha_solution,
                 }
-                res = self.session.post(f"{BASE_URL}/login", data=login_payload)
+                res = self.session.post(f"{BASE_URL}/login", data=login_payload, timeout=REQUEST_TIMEOUT)
                 res.raise_for_status()
 
-                if "error" in res.url or "Invalid LoginId" in res.text or "Invalid Username" in res.text:
-                    if "Invalid Captcha" in res.text:
+                body = res.content
+                if "error" in res.url or b"Invalid LoginId" in body or b"Invalid Username" in body:
+                    if b"Invalid Captcha" in body:
                         continue
                     else:
                         raise Exception("Invalid Credentials")
                 
-                soup = BeautifulSoup(res.text, "lxml")
-                self._get_csrf(soup)
-                reg_no_tag = soup.find("input", {"name": "authorizedIDX"})
-                if reg_no_tag and reg_no_tag.get('value'):
-                    self.reg_no = reg_no_tag['value']
+                self._get_csrf(body)
+                reg_no = _input_value(_REG_NO_INPUT, body)
+                if reg_no:
+                    self.reg_no = reg_no
                     self.is_authenticated = True
                     return
                 else:
@@ -211,6 +338,47 @@ class VtopClient:
         
         raise Exception(f"Login failed after {max_retries} attempts.")
 
+    def save_state(self, path):
+        """Save the logged-in session (cookies, CSRF token, registration number) to `path` as JSON.
+
+        Anyone holding the file can use the session until VTOP expires it, so
+        it is created readable by its owner only.
+        """
+        state = {
+            "cookies": [
+                {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "secure": c.secure}
+                for c in self.session.cookies
+            ],
+            "csrf_token": self.csrf_token,
+            "reg_no": self.reg_no,
+        }
+        with open(path, "w", opener=lambda p, flags: os.open(p, flags, 0o600)) as f:
+            json.dump(state, f)
+
+    def load_state(self, path):
+        """Resume a session saved by `save_state`, skipping the login flow while it is still valid.
+
+        The restored session is checked with a semester list request. If the
+        file is missing or unreadable, or VTOP has expired the session, this
+        falls back to `login()`.
+        """
+        try:
+            with open(path) as f:
+                state = json.load(f)
+            for cookie in state["cookies"]:
+                self.session.cookies.set(**cookie)
+            self.csrf_token = state["csrf_token"]
+            self.reg_no = state["reg_no"]
+            self.is_authenticated = True
+            # Cached results would answer without asking VTOP, so clear them first.
+            self.refresh()
+            self.get_semesters()
+        except Exception as e:
+            print(f"Saved session not usable, logging in: {e}")
+            self.session.cookies.clear()
+            self.is_authenticated = False
+            self.login()
+
     def _make_request(self, url, payload):
         if not self.is_authenticated:
             raise Exception("Session Expired. Please login again.")
@@ -218,26 +386,27 @@ class VtopClient:
         payload["_csrf"] = self.csrf_token
         payload["authorizedID"] = self.reg_no
 
-        res = self.session.post(url, data=payload)
-        res.raise_for_status()
+        with self.session.post(url, data=payload, timeout=REQUEST_TIMEOUT, stream=True) as res:
+            res.raise_for_status()
 
-        if "login" in res.url:
-            self.is_authenticated = False
-            raise Exception("Session Expired. Please login again.")
-        
-        return res.text
+            if "login" in res.url:
+                self.is_authenticated = False
+                raise Exception("Session Expired. Please login again.")
+
+            return _read_html(res)
     
+    @_cached
     def get_semesters(self):
         url = f"{BASE_URL}/academics/common/StudentTimeTable"
         payload = {"verifyMenu": "true"}
-        html = self._make_request(url, payload)
-        
-        soup = BeautifulSoup(html, 'lxml')
+        tree = self._make_request(url, payload)
+        get_text = self._get_text
+
         records = []
-        options = soup.select('select[name="semesterSubId"] option')
+        options = _SEMESTER_OPTIONS(tree)
         for option in options:
             value = option.get('value')
-            name = self._get_text(option)
+            name = get_text(option)
             if value and name and "Select" not in name:
                 records.append(SemesterInfo(id=value, name=name.replace("- AMR", "").strip()))
         return SemesterData(semesters=records, update_time=int(time.time()))
@@ -245,85 +414,69 @@ class VtopClient:
     def get_attendance(self, semester_id):
         url = f"{BASE_URL}/processViewStudentAttendance"
         payload = {"semesterSubId": semester_id}
-        html = self._make_request(url, payload)
+        tree = self._make_request(url, payload)
 
-        soup = BeautifulSoup(html, 'lxml')
-        rows = soup.find_all('tr')
         records = []
-        for row in rows[1:]:
-            cells = row.find_all('td')
-            if len(cells) > 10:
-                js_call = cells[10].find('a')['onclick']
-                parts = js_call.replace("'", "").split(',')
-                course_id = parts[2]
-                course_type = parts[3].split(')')[0]
-                records.append(AttendanceRecord(
-                    serial=self._get_text(cells[0]), category=self._get_text(cells[1]),
-                    course_name=self._get_text(cells[2]), course_code=self._get_text(cells[3]),
-                    faculty_detail=self._get_text(cells[4]), classes_attended=self._get_text(cells[5]),
-                    total_classes=self._get_text(cells[6]), attendance_percentage=self._get_text(cells[7]),
-                    attendence_fat_cat=self._get_text(cells[8]), debar_status=self._get_text(cells[9]),
-                    course_id=course_id, course_type=course_type
-                ))
+        for row in _ATTENDANCE_ROWS(tree):
+            cells = _CELLS(row)
+            js_call = cells[10].find('.//a').get('onclick')
+            course_id, course_type = _ONCLICK.search(js_call).group(3, 4)
+            texts = _cell_texts(cells[:10])
+            # The table's columns in order, with course_type and course_id from the link spliced in.
+            records.append(AttendanceRecord(*texts[:4], course_type, *texts[4:], course_id))
         return AttendanceData(records=records, semester_id=semester_id, update_time=int(time.time()))
 
+    @_cached
     def get_timetable(self, semester_id):
         url = f"{BASE_URL}/processViewTimeTable"
         payload = {"semesterSubId": semester_id}
-        html = self._make_request(url, payload)
+        tree = self._make_request(url, payload)
+        get_text = self._get_text
 
-        soup = BeautifulSoup(html, 'lxml')
-        tables = soup.find_all('table')
+        tables = list(tree.iter('table'))
         
         classname_code = {}
         if len(tables) > 0:
-            for row in tables[0].find_all('tr'):
-                cells = row.find_all('td')
+            for row in tables[0].iter('tr'):
+                cells = list(row.iter('td'))
                 if len(cells) > 2:
-                    full_text = self._get_text(cells[2])
-                    parts = full_text.split('-', 1)
-                    if len(parts) > 1:
-                        code = parts[0].strip()
-                        name = parts[1].split('(')[0].strip()
-                        classname_code[code] = name
+                    code, sep, rest = get_text(cells[2]).partition('-')
+                    if sep:
+                        classname_code[code.strip()] = rest.partition('(')[0].strip()
         
         slots = []
         timings_temp = []
         if len(tables) > 1:
-            rows = tables[1].find_all('tr')
+            rows = tables[1].iter('tr')
             day = ""
             count_for_offset = 0
 
             for row in rows:
-                cells = row.find_all('td')
-                if not cells:
+                texts = _cell_texts(row.iter('td'))
+                if not texts:
                     continue
                 
                 if count_for_offset == 0:
-                    for i, cell in enumerate(cells):
+                    for i, text in enumerate(texts):
                         timings_temp.append({
                             "serial": str(i),
-                            "start_time": self._get_text(cell),
+                            "start_time": text,
                             "end_time": ""
                         })
                 elif count_for_offset == 1:
-                    for i, cell in enumerate(cells):
+                    for i, text in enumerate(texts):
                         if i < len(timings_temp):
-                            timings_temp[i]["end_time"] = self._get_text(cell)
+                            timings_temp[i]["end_time"] = text
                 else:
-                    if len(cells) > 1:
-                        current_cells = list(cells)
+                    if len(texts) > 1:
                         start_index = 0
                         if count_for_offset % 2 == 0:
-                            day = self._get_text(current_cells[0])
-                            current_cells.pop(0)
+                            day = texts[0]
                             start_index = 1
                         
-                        for i, cell in enumerate(current_cells):
-                            original_index = i + start_index
-                            text = self._get_text(cell)
+                        for original_index, text in enumerate(texts[start_index:], start_index):
                             if len(text) > 5:
-                                parts = [p.strip() for p in text.split('-')]
+                                parts = _SLOT_FIELDS.split(text, maxsplit=5)
                                 if len(parts) >= 4:
                                     code = parts[1]
                                     slots.append(TimetableSlot(
@@ -345,70 +498,71 @@ class VtopClient:
         
         return TimetableData(slots=slots, semester_id=semester_id, update_time=int(time.time()))
 
+    @_cached
     def get_marks(self, semester_id):
         url = f"{BASE_URL}/examinations/doStudentMarkView"
         payload = {"semesterSubId": semester_id}
-        html = self._make_request(url, payload)
-        
-        soup = BeautifulSoup(html, 'lxml')
+        tree = self._make_request(url, payload)
+
         courses = []
-        rows = soup.select("tr.tableContent")
+        rows = _MARKS_ROWS(tree)
         
         for i in range(0, len(rows), 2):
             course_row = rows[i]
             marks_row = rows[i+1]
             
-            c_cells = course_row.find_all('td')
+            c_texts = _cell_texts(_CELLS(course_row))
             course_record = MarksRecord(
-                serial=self._get_text(c_cells[0]), coursecode=self._get_text(c_cells[2]),
-                coursetitle=self._get_text(c_cells[3]), coursetype=self._get_text(c_cells[4]),
-                faculity=self._get_text(c_cells[6]), slot=self._get_text(c_cells[7]), marks=[]
+                serial=c_texts[0], coursecode=c_texts[2],
+                coursetitle=c_texts[3], coursetype=c_texts[4],
+                faculity=c_texts[6], slot=c_texts[7], marks=[]
             )
             
-            marks_table = marks_row.find('table')
-            if marks_table:
-                for m_row in marks_table.select('tr.tableContent-level1'):
-                    m_cells = m_row.find_all('td')
-                    course_record.marks.append(MarksRecordEach(
-                        serial=self._get_text(m_cells[0]), markstitle=self._get_text(m_cells[1]),
-                        maxmarks=self._get_text(m_cells[2]), weightage=self._get_text(m_cells[3]),
-                        status=self._get_text(m_cells[4]), scoredmark=self._get_text(m_cells[5]),
-                        weightagemark=self._get_text(m_cells[6]), remark=self._get_text(m_cells[7])
-                    ))
+            for m_row in _MARKS_SUBROWS(marks_row):
+                course_record.marks.append(MarksRecordEach(*_cell_texts(_CELLS(m_row)[:8])))
             courses.append(course_record)
         return MarksData(records=courses, semester_id=semester_id, update_time=int(time.time()))
 
+    @_cached
     def get_exam_schedule(self, semester_id):
         url = f"{BASE_URL}/examinations/doSearchExamScheduleForStudent"
         payload = {"semesterSubId": semester_id}
-        html = self._make_request(url, payload)
-        
-        soup = BeautifulSoup(html, 'lxml')
+        tree = self._make_request(url, payload)
+
         exams = []
         current_exam_group = None
         
-        rows = soup.find('table')
-        if rows is None:
+        table = tree.find('.//table')
+        if table is None:
             return 
-        rows = rows.find_all('tr', recursive=False)
-        for row in rows[2:]:
-            cells = row.find_all('td', recursive=False)
+        for row in _EXAM_ROWS(table):
+            cells = _CELLS(row)
             if len(cells) == 1:
                 if current_exam_group:
                     exams.append(current_exam_group)
-                exam_type = self._get_text(cells[0].find('b'))
+                exam_type = self._get_text(cells[0].find('.//b'))
                 current_exam_group = PerExamScheduleRecord(exam_type=exam_type, records=[])
             elif len(cells) > 12 and current_exam_group:
-                current_exam_group.records.append(ExamScheduleRecord(
-                    serial=self._get_text(cells[0]), course_code=self._get_text(cells[1]),
-                    course_name=self._get_text(cells[2]), course_type=self._get_text(cells[3]),
-                    course_id=self._get_text(cells[4]), slot=self._get_text(cells[5]),
-                    exam_date=self._get_text(cells[6]), exam_session=self._get_text(cells[7]),
-                    reporting_time=self._get_text(cells[8]), exam_time=self._get_text(cells[9]),
-                    venue=self._get_text(cells[10]), seat_location=self._get_text(cells[11]),
-                    seat_no=self._get_text(cells[12])
-                ))
+                current_exam_group.records.append(ExamScheduleRecord(*_cell_texts(cells[:13])))
         if current_exam_group:
             exams.append(current_exam_group)
 
-        return ExamScheduleData(exams=exams, semester_id=semester_id, update_time=int(time.time()))
\ No newline at end of file
+        return ExamScheduleData(exams=exams, semester_id=semester_id, update_time=int(time.time()))
+
+    def fetch_all(self, semester_id):
+        """Fetch a semester's attendance, timetable, marks and exam schedule concurrently.
+
+        The four requests are independent, so they overlap on a thread pool and
+        take about as long as the slowest one. Returns a dict keyed by
+        "attendance", "timetable", "marks" and "exam_schedule"; the first
+        failure is raised.
+        """
+        fetchers = {
+            "attendance": self.get_attendance,
+            "timetable": self.get_timetable,
+            "marks": self.get_marks,
+            "exam_schedule": self.get_exam_schedule,
+        }
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {name: executor.submit(fetch, semester_id) for name, fetch in fetchers.items()}
+            return {name: future.result() for name, future in futures.items()}